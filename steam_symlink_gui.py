@@ -1,9 +1,18 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
+import errno
+import functools
 import os
 import sys
 import shutil
-import re
+import mmap
+import stat
 import platform
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 try:
@@ -16,47 +25,119 @@ except Exception as e:
 
 APP_TITLE = "Steam Download Symlink Helper"
 
+_IS_WINDOWS = platform.system() == "Windows"
+# On Windows, we need directory symlinks for directories
+_SYMLINK_KW = {"target_is_directory": True} if _IS_WINDOWS else {}
+
+
+def _expanduser(path: str) -> str:
+    return os.path.expandvars(os.path.expanduser(path))
+
+
+def _safe_stat(path) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _safe_lstat(path) -> os.stat_result | None:
+    try:
+        return os.lstat(path)
+    except OSError:
+        return None
+
+
+LIBRARYFOLDERS_CANDIDATES = (
+    "~/.local/share/Steam/steamapps/libraryfolders.vdf",
+    "~/.steam/steam/steamapps/libraryfolders.vdf",
+    "~/.var/app/com.valvesoftware.Steam/.local/share/Steam/steamapps/libraryfolders.vdf",
+)
+
 
-def _expanduser(path: str) -> Path:
-    return Path(os.path.expandvars(os.path.expanduser(path)))
+def _stat_libraryfolders_candidates() -> list[tuple[str, os.stat_result | None]]:
+    candidates = [_expanduser(p) for p in LIBRARYFOLDERS_CANDIDATES]
+    # Stat all candidates concurrently; home dirs may live on slow storage (NFS, Flatpak)
+    with ThreadPoolExecutor(max_workers=len(candidates)) as ex:
+        return list(ex.map(lambda p: (p, _safe_stat(p)), candidates))
 
 
-def find_libraryfolders_files() -> list[Path]:
+def find_libraryfolders_files() -> list[str]:
     """Return plausible paths to libraryfolders.vdf files on Linux, including Flatpak."""
-    candidates = [
-        _expanduser("~/.local/share/Steam/steamapps/libraryfolders.vdf"),
-        _expanduser("~/.steam/steam/steamapps/libraryfolders.vdf"),
-        _expanduser("~/.var/app/com.valvesoftware.Steam/.local/share/Steam/steamapps/libraryfolders.vdf"),
-    ]
-    seen = []
-    for p in candidates:
-        if p.exists() and p.is_file():
-            seen.append(p)
-    return seen
+    stats = _stat_libraryfolders_candidates()
+    return [p for p, st in stats if st is not None and stat.S_ISREG(st.st_mode)]
+
+
+def _scan_vdf_paths(buf) -> list[str]:
+    """Return the values of all "path" keys in a VDF buffer (bytes or mmap)."""
+    key = b'"path"'
+    paths: list[str] = []
+    n = len(buf)
+    i = buf.find(key)
+    while i != -1:
+        j = i + len(key)
+        k = j
+        while k < n and buf[k:k + 1] in (b" ", b"\t", b"\r", b"\n", b"\f", b"\v"):
+            k += 1
+        if k > j and buf[k:k + 1] == b'"':
+            end = buf.find(b'"', k + 1)
+            if end == -1:
+                break
+            if end > k + 1:
+                paths.append(buf[k + 1:end].decode("utf-8", errors="ignore"))
+            i = buf.find(key, end + 1)
+        else:
+            i = buf.find(key, j)
+    return paths
 
 
-def parse_libraryfolders(vdf_path: Path) -> list[Path]:
+def parse_libraryfolders(vdf_path: str) -> list[str]:
     """Parse a libraryfolders.vdf and return steam library root paths (SteamLibrary dirs).
 
-    We use a simple regex to extract all values of "path" entries. This works for both
+    We scan the memory-mapped file for all values of "path" entries. This works for both
     old and new VDF formats well enough for our purpose.
     """
     try:
-        text = vdf_path.read_text(encoding="utf-8", errors="ignore")
+        with open(vdf_path, "rb") as fd:
+            if os.fstat(fd.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                paths = _scan_vdf_paths(mm)
     except Exception:
         return []
 
-    paths = re.findall(r'"path"\s+"([^"]+)"', text)
-    results: list[Path] = []
+    results: list[str] = []
     for p in paths:
         lib = _expanduser(p)
-        if lib.exists():
+        if os.path.exists(lib):
             results.append(lib)
     return results
 
 
-def discover_steamapps_dirs() -> list[Path]:
-    """Return a list of existing steamapps directories across all libraries."""
+def _libraryfolders_signature() -> tuple:
+    """(path, mtime, is_file) fingerprint of all candidate libraryfolders.vdf files.
+
+    Each candidate is stat'ed once; the result doubles as the list of files to parse.
+    """
+    sig = []
+    for p, st in _stat_libraryfolders_candidates():
+        if st is None:
+            sig.append((p, None, False))
+        else:
+            sig.append((p, st.st_mtime_ns, stat.S_ISREG(st.st_mode)))
+    return tuple(sig)
+
+
+def discover_steamapps_dirs() -> list[str]:
+    """Return a list of existing steamapps directories across all libraries.
+
+    Results are cached until one of the libraryfolders.vdf files changes.
+    """
+    return list(_cached_discover(_libraryfolders_signature()))
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_discover(sig: tuple) -> tuple[str, ...]:
     steamapps = set()
 
     # Defaults
@@ -66,23 +147,32 @@ def discover_steamapps_dirs() -> list[Path]:
         _expanduser("~/.var/app/com.valvesoftware.Steam/.local/share/Steam/steamapps"),
     ]
     for p in default_steamapps:
-        if p.exists() and p.is_dir():
+        if os.path.isdir(p):
             steamapps.add(p)
 
     # From libraryfolders files
-    for vdf in find_libraryfolders_files():
+    vdfs = [p for p, _mtime, is_file in sig if is_file]
+    for vdf in vdfs:
         for lib_root in parse_libraryfolders(vdf):
-            sa = lib_root / "steamapps"
-            if sa.exists() and sa.is_dir():
+            sa = os.path.join(lib_root, "steamapps")
+            if os.path.isdir(sa):
                 steamapps.add(sa)
 
     # Sort nicely
-    return sorted(steamapps, key=lambda p: str(p))
+    return tuple(sorted(steamapps))
 
 
 def is_symlink_to(path: Path, target: Path) -> bool:
     try:
-        return path.is_symlink() and path.resolve() == target.resolve()
+        dest = os.readlink(path)
+    except OSError:
+        # Missing or not a symlink
+        return False
+    if dest == str(target):
+        return True
+    # Relative or differently spelled link: compare fully resolved paths
+    try:
+        return path.resolve() == target.resolve()
     except Exception:
         return False
 
@@ -92,13 +182,13 @@ def ensure_dir(path: Path):
 
 
 def dir_is_empty(path: Path) -> bool:
-    if not path.exists():
-        return True
-    if not path.is_dir():
-        return False
     try:
-        return next(path.iterdir(), None) is None
-    except Exception:
+        with os.scandir(path) as it:
+            return next(it, None) is None
+    except FileNotFoundError:
+        return True
+    except OSError:
+        # NotADirectoryError, permission errors, ...
         return False
 
 
@@ -108,14 +198,10 @@ def create_symlink_safe(link_path: Path, target_path: Path) -> tuple[bool, str]:
     Returns (success, message).
     """
     try:
-        # On Windows, we need directory symlinks for directories
-        if platform.system() == "Windows":
-            os.symlink(str(target_path), str(link_path), target_is_directory=True)
-        else:
-            os.symlink(str(target_path), str(link_path))
+        os.symlink(str(target_path), str(link_path), **_SYMLINK_KW)
         return True, f"Successfully created symlink: {link_path} -> {target_path}"
     except OSError as e:
-        if platform.system() == "Windows" and e.winerror == 1314:
+        if _IS_WINDOWS and e.winerror == 1314:
             # Privilege error on Windows
             return False, (
                 f"Failed to create symlink due to insufficient privileges.\n"
@@ -131,10 +217,142 @@ def create_symlink_safe(link_path: Path, target_path: Path) -> tuple[bool, str]:
         return False, f"Unexpected error creating symlink: {e}\nTarget: {link_path} -> {target_path}"
 
 
-def move_dir_contents(src: Path, dst: Path):
+def _plan_merge(src: str, dst: str) -> list[tuple[os.DirEntry, str, os.stat_result | None, list | None]]:
+    """Scan src against dst once and return (entry, dst_path, dst_stat, sub_plan) tuples.
+
+    sub_plan is set for directories that already exist in dst and must be merged.
+    Raises FileExistsError on a file/directory clash, before anything is moved.
+    """
+    plan = []
+    with os.scandir(src) as it:
+        for entry in it:
+            dst_path = os.path.join(dst, entry.name)
+            dst_st = _safe_lstat(dst_path)
+            sub_plan = None
+            if dst_st is not None:
+                src_is_dir = entry.is_dir(follow_symlinks=False)
+                if src_is_dir != stat.S_ISDIR(dst_st.st_mode):
+                    raise FileExistsError(errno.EEXIST, "Cannot merge a file and a directory", dst_path)
+                if src_is_dir:
+                    sub_plan = _plan_merge(entry.path, dst_path)
+            plan.append((entry, dst_path, dst_st, sub_plan))
+    return plan
+
+
+def _copy_then_delete(entry: os.DirEntry, dst_path: str):
+    """Cross-filesystem move of a single entry (what shutil.move does after rename fails)."""
+    if entry.is_symlink():
+        os.symlink(os.readlink(entry.path), dst_path)
+        os.unlink(entry.path)
+    elif entry.is_dir(follow_symlinks=False):
+        shutil.copytree(entry.path, dst_path, symlinks=True)
+        shutil.rmtree(entry.path)
+    else:
+        shutil.copy2(entry.path, dst_path)
+        os.unlink(entry.path)
+
+
+def _merge_dir(plan: list, same_fs: bool) -> bool:
+    for entry, dst_path, dst_st, sub_plan in plan:
+        if sub_plan is not None:
+            # Both are directories: merge recursively
+            same_fs = _merge_dir(sub_plan, same_fs)
+            os.rmdir(entry.path)
+            continue
+        if same_fs:
+            try:
+                os.replace(entry.path, dst_path)
+                continue
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Every later entry would fail the same way
+                same_fs = False
+        if dst_st is not None:
+            os.unlink(dst_path)
+        _copy_then_delete(entry, dst_path)
+    return same_fs
+
+
+def move_dir_contents(src: Path, dst: Path, same_fs: bool = True):
+    """Move everything inside src into dst, merging into existing subdirectories.
+
+    Files already present in dst are overwritten. A file/directory clash is
+    detected before anything is moved, so a failure cannot leave a half-moved tree.
+    Pass same_fs=False when src and dst are known to be on different filesystems
+    to skip the rename attempts.
+    """
     ensure_dir(dst)
-    for item in src.iterdir():
-        shutil.move(str(item), str(dst / item.name))
+    _merge_dir(_plan_merge(str(src), str(dst)), same_fs)
+
+
+def move_dir(src: Path, dst: Path):
+    """Move directory src to dst, leaving src removed.
+
+    On the same filesystem an empty/missing dst is replaced by src with a single
+    rename. Otherwise the contents are merged into dst via move_dir_contents(),
+    which skips renames entirely when the devices are known to differ.
+    """
+    src_st = _safe_stat(src)
+    dst_st = _safe_stat(dst)
+    dev_st = dst_st if dst_st is not None else _safe_stat(dst.parent)
+    same_fs = src_st is not None and dev_st is not None and src_st.st_dev == dev_st.st_dev
+    if same_fs and (dst_st is None or dir_is_empty(dst)):
+        try:
+            if dst_st is not None:
+                os.rmdir(dst)
+            os.rename(src, dst)
+            return
+        except OSError:
+            pass
+    move_dir_contents(src, dst, same_fs)
+    # Remove the emptied directory in one go
+    shutil.rmtree(src)
+
+
+# Action kinds produced by classify_link()
+NOOP = "noop"
+RECREATE_TARGET = "recreate_target"
+REPLACE_SYMLINK = "replace_symlink"
+EMPTY_REPLACE = "empty_replace"
+MOVE_THEN_LINK = "move_then_link"
+CREATE_NEW = "create_new"
+ERROR = "error"
+
+# Shown in the confirmation dialog; NOOP and ERROR links are only logged
+ACTION_DESCRIPTIONS = {
+    RECREATE_TARGET: "already linked, but the SSD target is missing; recreate it",
+    REPLACE_SYMLINK: "replace existing symlink that points elsewhere",
+    EMPTY_REPLACE: "replace empty directory with symlink",
+    MOVE_THEN_LINK: "move existing contents to SSD, then replace with symlink",
+    CREATE_NEW: "create symlink",
+}
+
+
+@dataclass
+class Action:
+    kind: str
+    link_path: Path
+    target_path: Path
+
+
+def classify_link(link_path: Path, target_path: Path) -> str:
+    """Decide what needs to happen to link_path, using a single lstat."""
+    try:
+        st = os.lstat(link_path)
+    except FileNotFoundError:
+        return CREATE_NEW
+    if stat.S_ISLNK(st.st_mode):
+        if not is_symlink_to(link_path, target_path):
+            return REPLACE_SYMLINK
+        # A link to a deleted/reformatted target is dangling, not "already correct"
+        target_st = _safe_stat(target_path)
+        if target_st is None or not stat.S_ISDIR(target_st.st_mode):
+            return RECREATE_TARGET
+        return NOOP
+    if stat.S_ISDIR(st.st_mode):
+        return EMPTY_REPLACE if dir_is_empty(link_path) else MOVE_THEN_LINK
+    return ERROR
 
 
 class App(tk.Tk):
@@ -143,7 +361,18 @@ class App(tk.Tk):
         self.title(APP_TITLE)
         self.minsize(720, 420)
 
+        # Callables queued by the worker thread, run on the Tk main thread
+        self._ui_queue: queue.Queue = queue.Queue()
+        self.after(100, self._drain_ui_queue)
+
+        # Log lines are buffered and written to the Text widget in batches
+        self._log_buf: list[str] = []
+        self._log_flush_scheduled = False
+
+        self._worker_thread: threading.Thread | None = None
+
         self._make_widgets()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         self._populate_defaults()
         self._show_windows_warning()
 
@@ -177,8 +406,10 @@ class App(tk.Tk):
         row += 1
         btns = ttk.Frame(main)
         btns.grid(row=row, column=0, columnspan=3, sticky="we", pady=(pad, pad))
-        ttk.Button(btns, text="Create Symlinks", command=self._run).pack(side=tk.LEFT)
-        ttk.Button(btns, text="Quit", command=self.destroy).pack(side=tk.LEFT, padx=(pad, 0))
+        self.run_btn = ttk.Button(btns, text="Create Symlinks", command=self._run)
+        self.run_btn.pack(side=tk.LEFT)
+        self.quit_btn = ttk.Button(btns, text="Quit", command=self._on_close)
+        self.quit_btn.pack(side=tk.LEFT, padx=(pad, 0))
 
         # Log area
         row += 1
@@ -191,8 +422,7 @@ class App(tk.Tk):
         main.rowconfigure(row, weight=1)
 
     def _populate_defaults(self):
-        options = discover_steamapps_dirs()
-        opts = [str(p) for p in options]
+        opts = discover_steamapps_dirs()
         self.steamapps_combo["values"] = opts
         if opts:
             self.steamapps_combo.current(0)
@@ -215,15 +445,63 @@ class App(tk.Tk):
             self.dest_var.set(d)
 
     def _append_log(self, msg: str):
-        self.log.insert(tk.END, msg + "\n")
+        self._log_buf.append(msg)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after(50, self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_scheduled = False
+        if not self._log_buf:
+            return
+        text = "\n".join(self._log_buf) + "\n"
+        self._log_buf.clear()
+        self.log.insert(tk.END, text)
         self.log.see(tk.END)
 
     def _confirm(self, title: str, message: str) -> bool:
         return messagebox.askyesno(title, message)
 
+    def _drain_ui_queue(self):
+        try:
+            while True:
+                try:
+                    func, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    func(*args)
+                except Exception as e:
+                    # Keep draining; a failed dialog must not stall the worker's updates
+                    self._append_log(f"ERROR: UI callback failed: {e}")
+        finally:
+            self.after(100, self._drain_ui_queue)
+
+    def _post_ui(self, func, *args):
+        """Schedule func(*args) on the Tk main thread (safe to call from the worker)."""
+        self._ui_queue.put((func, args))
+
+    def _log_async(self, msg: str):
+        self._post_ui(self._append_log, msg)
+
+    def _on_close(self):
+        if self._worker_thread is not None and self._worker_thread.is_alive():
+            # Exiting would kill the worker mid-copy and leave a partial move without a symlink
+            messagebox.showwarning(
+                "Busy",
+                "Files are still being moved. Please wait until the operation finishes before quitting.",
+            )
+            return
+        self.destroy()
+
+    def _set_busy(self, busy: bool):
+        flag = "disabled" if busy else "!disabled"
+        self.run_btn.state([flag])
+        self.quit_btn.state([flag])
+
     def _show_windows_warning(self):
         """Show Windows-specific symlink privilege warning if on Windows."""
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             warning_msg = (
                 "Windows Symlink Requirements:\n\n"
                 "This application creates symbolic links, which on Windows requires either:\n"
@@ -262,104 +540,110 @@ class App(tk.Tk):
             if not ok:
                 return
 
-        if not steamapps.exists() or not steamapps.is_dir():
+        st = _safe_stat(steamapps)
+        if st is None or not stat.S_ISDIR(st.st_mode):
             messagebox.showerror("Invalid path", f"Not a directory: {steamapps}")
             return
 
         dest_base = Path(dest_base_str)
-        ensure_dir(dest_base)
 
-        # Create a unique subfolder per library, named after parent of steamapps
+        # Use a unique subfolder per library, named after parent of steamapps
         lib_name = steamapps.parent.name or "steam_library"
         target_root = dest_base / f"{lib_name}_symlink"
-        ensure_dir(target_root)
 
         plan = [("downloading", True)]
         if self.link_temp_var.get():
             plan.append(("temp", True))
 
+        actions = [
+            Action(classify_link(steamapps / sub, target_root / sub), steamapps / sub, target_root / sub)
+            for sub, _ in plan
+        ]
+
+        # Links that need no change, or cannot be changed, are reported once here
+        for action in actions:
+            if action.kind == NOOP:
+                self._append_log(f"OK: {action.link_path} already links to {action.target_path}")
+            elif action.kind == ERROR:
+                self._append_log(f"ERROR: Path exists and is not a directory, skipped: {action.link_path}")
+        actions = [action for action in actions if action.kind not in (NOOP, ERROR)]
+        if not actions:
+            return
+
         summary_lines = [
             f"Library steamapps: {steamapps}",
             f"Target root on SSD: {target_root}",
         ]
-        for sub, _ in plan:
-            summary_lines.append(f"  - {sub}: {steamapps/sub} -> {target_root/sub}")
+        for action in actions:
+            summary_lines.append(
+                f"  - {action.link_path} -> {action.target_path}\n"
+                f"      {ACTION_DESCRIPTIONS[action.kind]}"
+            )
 
-        if not self._confirm("Proceed?", "This will create/replace symlinks as follows:\n\n" + "\n".join(summary_lines)):
+        if not self._confirm("Proceed?", "The following changes will be made:\n\n" + "\n".join(summary_lines)):
             return
 
-        for sub, _ in plan:
-            link_path = steamapps / sub
-            target_path = target_root / sub
-            ensure_dir(target_path)
-
-            # Handle existing link_path
-            if link_path.is_symlink():
-                if is_symlink_to(link_path, target_path):
-                    self._append_log(f"OK: {link_path} already links to {target_path}")
-                    continue
-                else:
-                    if not self._confirm(
-                        "Replace symlink",
-                        f"{link_path} is a symlink to a different target. Replace it?",
-                    ):
-                        self._append_log(f"Skipped replacing symlink: {link_path}")
-                        continue
-                    link_path.unlink()
-                    success, message = create_symlink_safe(link_path, target_path)
-                    if success:
-                        self._append_log(f"Replaced symlink: {link_path} -> {target_path}")
-                    else:
-                        self._append_log(f"ERROR: {message}")
-                        messagebox.showerror("Symlink Error", message)
-                    continue
-
-            if link_path.exists():
-                if link_path.is_dir():
-                    if dir_is_empty(link_path):
-                        # Remove empty dir and link
-                        link_path.rmdir()
-                        success, message = create_symlink_safe(link_path, target_path)
-                        if success:
-                            self._append_log(f"Linked (empty replaced): {link_path} -> {target_path}")
-                        else:
-                            self._append_log(f"ERROR: {message}")
-                            messagebox.showerror("Symlink Error", message)
-                    else:
-                        # Offer to move contents then link
-                        if not self._confirm(
-                            "Move contents?",
-                            f"{link_path} is a non-empty directory. Move its contents to {target_path} and replace with a symlink?",
-                        ):
-                            self._append_log(f"Skipped: left existing directory: {link_path}")
-                            continue
-                        move_dir_contents(link_path, target_path)
-                        # Remove the now-empty directory
-                        try:
-                            link_path.rmdir()
-                        except OSError:
-                            # Fallback in case hidden files remain
-                            shutil.rmtree(link_path)
-                        success, message = create_symlink_safe(link_path, target_path)
-                        if success:
-                            self._append_log(f"Moved contents and linked: {link_path} -> {target_path}")
-                        else:
-                            self._append_log(f"ERROR: {message}")
-                            messagebox.showerror("Symlink Error", message)
-                else:
-                    messagebox.showerror("Path exists and is not a directory", str(link_path))
-                    self._append_log(f"ERROR: Path exists and is not a directory: {link_path}")
-                    continue
-            else:
-                # Create new symlink
-                success, message = create_symlink_safe(link_path, target_path)
-                if success:
-                    self._append_log(f"Linked: {link_path} -> {target_path}")
-                else:
-                    self._append_log(f"ERROR: {message}")
-                    messagebox.showerror("Symlink Error", message)
-
-        messagebox.showinfo("Done", "Requested symlinks processed. Check the log for details.")
+        self._set_busy(True)
+        self._worker_thread = threading.Thread(target=self._worker, args=(actions, target_root), daemon=True)
+        self._worker_thread.start()
+
+    def _worker(self, actions: list[Action], target_root: Path):
+        """Execute actions that modify the filesystem (NOOP/ERROR are filtered out by _do_run)."""
+        try:
+            # Creates dest_base as well
+            os.makedirs(target_root, exist_ok=True)
+            for action in actions:
+                try:
+                    self._execute_action(action)
+                except OSError as e:
+                    # Report and carry on with the remaining links
+                    message = f"Failed to process {action.link_path}: {e}"
+                    self._log_async(f"ERROR: {message}")
+                    self._post_ui(messagebox.showerror, "Error", message)
+            self._post_ui(messagebox.showinfo, "Done", "Requested symlinks processed. Check the log for details.")
+        except Exception as e:
+            self._post_ui(messagebox.showerror, "Error", f"Unexpected error: {e}")
+            self._log_async(f"ERROR: {e}")
+        finally:
+            self._post_ui(self._set_busy, False)
+
+    def _execute_action(self, action: Action):
+        link_path, target_path = action.link_path, action.target_path
+
+        # move_dir() creates (or renames onto) a missing target itself; the
+        # remaining kinds need it to exist before the symlink is created.
+        if action.kind == RECREATE_TARGET:
+            os.makedirs(target_path, exist_ok=True)
+            self._log_async(f"Recreated missing target: {target_path} (linked from {link_path})")
+            return
+        if action.kind == REPLACE_SYMLINK:
+            os.makedirs(target_path, exist_ok=True)
+            link_path.unlink()
+            done_msg = f"Replaced symlink: {link_path} -> {target_path}"
+        elif action.kind == EMPTY_REPLACE:
+            try:
+                link_path.rmdir()
+                os.makedirs(target_path, exist_ok=True)
+                done_msg = f"Linked (empty replaced): {link_path} -> {target_path}"
+            except OSError as e:
+                if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                    raise
+                # Something was written into it since the confirmation dialog
+                move_dir(link_path, target_path)
+                done_msg = f"Moved contents and linked: {link_path} -> {target_path}"
+        elif action.kind == MOVE_THEN_LINK:
+            move_dir(link_path, target_path)
+            done_msg = f"Moved contents and linked: {link_path} -> {target_path}"
+        else:
+            os.makedirs(target_path, exist_ok=True)
+            done_msg = f"Linked: {link_path} -> {target_path}"
+
+        success, message = create_symlink_safe(link_path, target_path)
+        if success:
+            self._log_async(done_msg)
+        else:
+            self._log_async(f"ERROR: {message}")
+            self._post_ui(messagebox.showerror, "Symlink Error", message)
 
 
 def main():